@@ -2,7 +2,6 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
-from datetime import datetime, timedelta
 
 def plot_tle_animation(tle_filename):
 
@@ -10,15 +9,11 @@ def plot_tle_animation(tle_filename):
     with open(tle_filename, 'r') as f:
         lines = [line.strip() for line in f.readlines()]
 
-    # Collect valid TLE pairs
-    satellite_TLEs = []
-    idx = 0
-    while idx < len(lines) - 1:
-        if lines[idx].startswith('1') and lines[idx+1].startswith('2'):
-            satellite_TLEs.append((lines[idx], lines[idx+1]))
-            idx += 2
-        else:
-            idx += 1
+    # Collect valid TLE pairs: a line starting with '1' directly followed
+    # by one starting with '2'
+    first_char = np.array(lines, dtype='U1')
+    pair_start = np.flatnonzero((first_char[:-1] == '1') & (first_char[1:] == '2'))
+    satellite_TLEs = [(lines[idx], lines[idx+1]) for idx in pair_start]
     # ------------------ 2) SETUP FIGURE FOR 3D ANIMATION ------------------
     fig = plt.figure(figsize=(8,6))
     ax = fig.add_subplot(111, projection='3d')
@@ -29,15 +24,19 @@ def plot_tle_animation(tle_filename):
     ax.set_title('Satellite Orbits Animation')
     ax.set_box_aspect([1,1,1])
 
-    u, v = np.mgrid[0:2*np.pi:40j, 0:np.pi:30j]
+    u = np.linspace(0, 2*np.pi, 20)
+    v = np.linspace(0, np.pi, 15)
+    cos_u, sin_u = np.cos(u), np.sin(u)
+    cos_v, sin_v = np.cos(v), np.sin(v)
     rx = 6378
     ry = 6378
     rz = 6356
 
-    ax.plot_wireframe(rx*np.cos(u)*np.sin(v),
-                      ry*np.sin(u)*np.sin(v),
-                      rz*np.cos(v),color="purple",
-                      alpha=0.5,lw = 0.5, zorder=0)
+    ax.plot_surface(rx*np.outer(cos_u, sin_v),
+                    ry*np.outer(sin_u, sin_v),
+                    rz*np.outer(np.ones_like(u), cos_v), color="purple",
+                    alpha=0.5, rstride=1, cstride=1, linewidth=0,
+                    antialiased=False, zorder=0)
     
     #print((r*np.cos(u)[0,0]*np.sin(v)[0,0],
       # r*np.sin(u)[0,0]*np.sin(v)[0,0],
@@ -50,51 +49,60 @@ def plot_tle_animation(tle_filename):
     mu_earth = 398600.4418  # [km^3/s^2]
 
     # ------------------ 3) PARSE TLE LINES & ORBITAL ELEMENTS ------------------
-    for line1, line2 in satellite_TLEs:
-
-        # Use satellite catalog number or a substring as "name"
-        sat_name = line2[2:7].strip()
-
-        # 3.1) Parse epoch from line 1
-        epoch_year = int(line1[18:20])
-        epoch_dayFrac = float(line1[20:32])
-
-        # Determine the full year
-        if epoch_year < 57:
-            year_full = 2000 + epoch_year
-        else:
-            year_full = 1900 + epoch_year
-
-        # Approximate epoch as Python datetime
-        # day-of-year 1 => Jan 1, so subtract 1 then add days
-        epoch_dt = datetime(year_full, 1, 1) + timedelta(days=(epoch_dayFrac - 1))
-
-        # 3.2) Parse orbital elements from line 2
-        inc_deg = float(line2[8:16])
-        raan_deg = float(line2[17:25])
-        ecc_str = "0." + line2[26:33].strip()
-        ecc = float(ecc_str)
-        argp_deg = float(line2[34:42])
-        M0_deg = float(line2[43:51])
-        mean_motion = float(line2[52:63])  # rev/day
-
-        # 3.3) Mean motion (rad/sec)
-        n_radSec = mean_motion * 2.0 * np.pi / 86400.0  # 24*3600 = 86400
-
-        # 3.4) Semi-major axis [km] from mean motion in 2-body approximation
-        a = (mu_earth / (n_radSec**2)) ** (1.0/3.0)
-
-        # Store data
+    # Pack the lines into fixed-width (N, 69) byte arrays so each TLE field
+    # is a column slice that can be converted for all satellites at once
+    line1 = np.array([l1 for l1, _ in satellite_TLEs], dtype='S69').view('S1').reshape(-1, 69)
+    line2 = np.array([l2 for _, l2 in satellite_TLEs], dtype='S69').view('S1').reshape(-1, 69)
+
+    def column(lines, start, stop):
+        return np.ascontiguousarray(lines[:, start:stop]).view(f'S{stop - start}').ravel()
+
+    # Use satellite catalog number or a substring as "name"
+    sat_names = np.char.strip(np.char.decode(column(line2, 2, 7)))
+
+    # 3.1) Parse epoch from line 1
+    epoch_year = column(line1, 18, 20).astype(int)
+    epoch_dayFrac = column(line1, 20, 32).astype(float)
+
+    # Determine the full year
+    year_full = np.where(epoch_year < 57, 2000 + epoch_year, 1900 + epoch_year)
+
+    # Approximate epoch as datetime64
+    # day-of-year 1 => Jan 1, so subtract 1 then add days
+    epoch_dt = ((year_full - 1970).astype('datetime64[Y]').astype('datetime64[us]')
+                + np.round((epoch_dayFrac - 1) * 86400e6).astype('timedelta64[us]'))
+
+    # 3.2) Parse orbital elements from line 2
+    inc_deg = column(line2, 8, 16).astype(float)
+    raan_deg = column(line2, 17, 25).astype(float)
+    ecc = column(line2, 26, 33).astype(float) / 1e7
+    argp_deg = column(line2, 34, 42).astype(float)
+    M0_deg = column(line2, 43, 51).astype(float)
+    mean_motion = column(line2, 52, 63).astype(float)  # rev/day
+
+    inc_rad = np.radians(inc_deg)
+    raan_rad = np.radians(raan_deg)
+    argp_rad = np.radians(argp_deg)
+    M0_rad = np.radians(M0_deg)
+
+    # 3.3) Mean motion (rad/sec)
+    n_radSec = mean_motion * 2.0 * np.pi / 86400.0  # 24*3600 = 86400
+
+    # 3.4) Semi-major axis [km] from mean motion in 2-body approximation
+    a = (mu_earth / (n_radSec**2)) ** (1.0/3.0)
+
+    # Store data
+    for k in range(len(satellite_TLEs)):
         satellites.append({
-            'name':     sat_name,
-            'epoch':    epoch_dt,
-            'a':        a,
-            'e':        ecc,
-            'i':        np.radians(inc_deg),
-            'RAAN':     np.radians(raan_deg),
-            'omega':    np.radians(argp_deg),
-            'M0':       np.radians(M0_deg),
-            'n':        n_radSec
+            'name':     sat_names[k],
+            'epoch':    epoch_dt[k],
+            'a':        a[k],
+            'e':        ecc[k],
+            'i':        inc_rad[k],
+            'RAAN':     raan_rad[k],
+            'omega':    argp_rad[k],
+            'M0':       M0_rad[k],
+            'n':        n_radSec[k]
         })
 
     # ------------------ 4) PRE-COMPUTE ORBITAL POSITIONS ------------------
@@ -215,18 +223,20 @@ def plot_tle_animation(tle_filename):
     def update(frame):
         # Update marker positions at time = frame
         for i, sat in enumerate(satellites):
-            sat_markers[i].set_data_3d(
-                [sat['X'][frame]], 
-                [sat['Y'][frame]],
-                [sat['Z'][frame]]
-            )
-        return sat_markers
+            sat_markers[i].set_data([sat['X'][frame]], [sat['Y'][frame]])
+            sat_markers[i].set_3d_properties([sat['Z'][frame]])
+        return tuple(sat_markers)
+
+    def init():
+        return update(0)
+
+    # Fix the axis limits first so blitting only has to redraw the markers
+    set_aspect_equal_3d(ax)
 
     # Create animation
-    ani = FuncAnimation(fig, update, frames=num_steps,
-                        interval=30, blit=False, repeat=True)
+    ani = FuncAnimation(fig, update, frames=num_steps, init_func=init,
+                        interval=30, blit=True, repeat=True)
     #plt.tight_layout()
-    set_aspect_equal_3d(ax)
     plt.show()
 
 
@@ -10,8 +10,8 @@ import matplotlib.pyplot as plt
 # Add the parent directory to the path to import project modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.spacecraft import Spacecraft
-from src.orbital_mechanics import propagate_orbit
+from src.spacecraft import SatelliteCatalog
+from src.orbital_mechanics import propagate_orbits_batch
 from src.plotting_tools import OrbitPlotter
 
 def main():
@@ -25,19 +25,20 @@ def main():
         return
     
     # Load the TLE data
-    satellites = Spacecraft.from_tle_file(tle_file)
+    catalog = SatelliteCatalog.from_tle_file(tle_file)
+    periods = catalog.get_periods()
     
     # Print information about the loaded satellites
-    print(f"Loaded {len(satellites)} satellites from {tle_file}")
+    print(f"Loaded {len(catalog)} satellites from {tle_file}")
     print("\nSatellite Information:")
     print("-" * 60)
     
-    for i, sat in enumerate(satellites):
-        period_hours = sat.get_period() / 3600  # Convert seconds to hours
-        print(f"{i+1}. {sat.name}:")
-        print(f"   Semi-major axis: {sat.a:.1f} km")
-        print(f"   Eccentricity: {sat.e:.6f}")
-        print(f"   Inclination: {np.degrees(sat.i):.2f}°")
+    for i in range(len(catalog)):
+        period_hours = periods[i] / 3600  # Convert seconds to hours
+        print(f"{i+1}. {catalog.names[i]}:")
+        print(f"   Semi-major axis: {catalog.a[i]:.1f} km")
+        print(f"   Eccentricity: {catalog.e[i]:.6f}")
+        print(f"   Inclination: {np.degrees(catalog.i[i]):.2f}°")
         print(f"   Period: {period_hours:.2f} hours")
         print()
     
@@ -49,7 +50,7 @@ def main():
     
     # Define duration for visualization (in seconds)
     # Use twice the period of the longest-period satellite
-    max_period = max(sat.get_period() for sat in satellites)
+    max_period = periods.max()
     duration = 2 * max_period
     
     # Number of steps for propagation
@@ -61,16 +62,12 @@ def main():
     # Colors for the different satellites
     colors = ['red', 'green', 'blue', 'orange', 'purple', 'cyan']
     
-    # Add each satellite to the visualization
-    for i, sat in enumerate(satellites):
-        # Set color (cycling through the color list if needed)
-        color = colors[i % len(colors)]
-        
-        # Propagate orbit
-        X, Y, Z = propagate_orbit(sat, tspan)
-        
-        # Add to plotter
-        plotter.add_spacecraft(X, Y, Z, label=sat.name, color=color)
+    # Propagate all orbits at once, each array has shape (n_sats, num_steps)
+    X, Y, Z = propagate_orbits_batch(catalog, tspan)
+    
+    # Add all satellites to the visualization, cycling through the colors
+    sat_colors = [colors[i % len(colors)] for i in range(len(catalog))]
+    plotter.add_spacecraft_batch(X, Y, Z, labels=catalog.names, colors=sat_colors)
     
     # Add a legend
     plotter.add_legend(loc='upper left')
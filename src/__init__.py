@@ -3,9 +3,9 @@ Orbital simulation package - tools for simulating and visualizing satellite orbi
 """
 
 # Make key classes available directly from the package
-from .spacecraft import Spacecraft
+from .spacecraft import Spacecraft, SatelliteCatalog
 from .plotting_tools import OrbitPlotter
-from .orbital_mechanics import propagate_orbit
+from .orbital_mechanics import propagate_orbit, propagate_orbits_batch
 from .planetary_data import Earth, CELESTIAL_BODIES
 
 # Define package metadata
\ No newline at end of file
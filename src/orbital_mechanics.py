@@ -4,33 +4,79 @@ orbital_mechanics.py - Orbital mechanics calculations and propagation
 
 import numpy as np
 
-def solve_kepler(M, e, tolerance=1e-8, max_iterations=10):
+try:
+    from .orbital_mechanics_numba import _propagate, _propagate_batch
+except ImportError:
+    # Numba is optional; fall back to the vectorized NumPy implementation
+    _propagate = _propagate_batch = None
+
+def solve_kepler(M, e):
     """
     Solve Kepler's equation for eccentric anomaly
     
+    Uses Markley's (1995) non-iterative method: a cubic starting estimate
+    followed by a single fifth-order correction, accurate to machine
+    precision for all elliptical orbits.
+    
+    Parameters:
+        M (float or ndarray): Mean anomaly in radians
+        e (float): Eccentricity
+        
+    Returns:
+        float or ndarray: Eccentric anomaly in radians
+    """
+    M = np.asarray(M, dtype=float)
+    
+    # Reduce mean anomaly to [-pi, pi]
+    M_red = np.remainder(M + np.pi, 2.0 * np.pi) - np.pi
+    
+    # Cubic starting estimate
+    pi2 = np.pi ** 2
+    alpha = (3.0 * pi2 + 1.6 * np.pi * (np.pi - np.abs(M_red)) / (1.0 + e)) / (pi2 - 6.0)
+    d = 3.0 * (1.0 - e) + alpha * e
+    q = 2.0 * alpha * d * (1.0 - e) - M_red ** 2
+    r = 3.0 * alpha * d * (d - 1.0 + e) * M_red + M_red ** 3
+    w = (np.abs(r) + np.sqrt(q ** 3 + r ** 2)) ** (2.0 / 3.0)
+    E1 = (2.0 * r * w / (w ** 2 + w * q + q ** 2) + M_red) / d
+    
+    # Fifth-order correction
+    es, ec = e * np.sin(E1), e * np.cos(E1)
+    f0 = E1 - es - M_red
+    f1 = 1.0 - ec
+    f2 = es
+    f3 = ec
+    d3 = -f0 / (f1 - 0.5 * f0 * f2 / f1)
+    d4 = -f0 / (f1 + 0.5 * d3 * f2 + d3 ** 2 * f3 / 6.0)
+    d5 = -f0 / (f1 + 0.5 * d4 * f2 + d4 ** 2 * f3 / 6.0 - d4 ** 3 * f2 / 24.0)
+    
+    # Restore the whole revolutions removed by the reduction
+    return E1 + d5 + (M - M_red)
+
+def solve_kepler_newton(M, e, iterations=10):
+    """
+    Solve Kepler's equation for eccentric anomaly by Newton-Raphson iteration
+    
+    Runs a fixed number of iterations over the whole array instead of
+    checking convergence element by element.
+    
     Parameters:
-        M (float): Mean anomaly in radians
+        M (float or ndarray): Mean anomaly in radians
         e (float): Eccentricity
-        tolerance (float): Error tolerance for convergence
-        max_iterations (int): Maximum number of iterations
+        iterations (int): Number of Newton-Raphson iterations
         
     Returns:
-        float: Eccentric anomaly in radians
+        float or ndarray: Eccentric anomaly in radians
     """
-    # Initial guess
-    if e < 0.8:
-        E = M  # For low eccentricity, M is a good initial guess
-    else:
-        E = np.pi  # For high eccentricity, pi is a better initial guess
+    M = np.asarray(M, dtype=float)
+    
+    # Danby's initial guess, close to the root for any eccentricity
+    E = M + 0.85 * e * np.sign(np.sin(M))
     
     # Newton-Raphson iteration
-    for i in range(max_iterations):
-        E_new = E - (E - e * np.sin(E) - M) / (1.0 - e * np.cos(E))
-        if abs(E_new - E) < tolerance:
-            return E_new
-        E = E_new
+    for _ in range(iterations):
+        s, c = np.sin(E), np.cos(E)
+        E -= (E - e * s - M) / (1.0 - e * c)
     
-    # Return best estimate even if not fully converged
     return E
 
 def true_anomaly_from_eccentric(E, e):
@@ -63,43 +109,46 @@ def orbital_radius(a, e, E):
     """
     return a * (1.0 - e * np.cos(E))
 
+def rotation_matrix(RAAN, inc, omega):
+    """
+    Build the perifocal to Earth-Centered Inertial (ECI) rotation matrix
+    
+    Closed-form expansion of Rz(RAAN) @ Rx(inc) @ Rz(omega), so the
+    orbit-constant trig terms are evaluated only once.
+    
+    Parameters:
+        RAAN (float or ndarray): Right Ascension of Ascending Node in radians
+        inc (float or ndarray): Inclination in radians
+        omega (float or ndarray): Argument of periapsis in radians
+        
+    Returns:
+        ndarray: 3x3 rotation matrix Q, or (3, 3, N) for length-N angle arrays
+    """
+    cR, sR = np.cos(RAAN), np.sin(RAAN)
+    ci, si = np.cos(inc), np.sin(inc)
+    cw, sw = np.cos(omega), np.sin(omega)
+    
+    return np.array([
+        [cR * cw - sR * sw * ci, -cR * sw - sR * cw * ci,  sR * si],
+        [sR * cw + cR * sw * ci, -sR * sw + cR * cw * ci, -cR * si],
+        [               sw * si,                 cw * si,       ci]
+    ])
+
 def perifocal_to_eci(r_perifocal, RAAN, inc, omega):
     """
     Transform from perifocal to Earth-Centered Inertial (ECI) coordinates
     
     Parameters:
-        r_perifocal (ndarray): Position vector in perifocal frame [x, y, z]
+        r_perifocal (ndarray): Position vector in perifocal frame [x, y, z],
+            or a (3, N) array of position vectors
         RAAN (float): Right Ascension of Ascending Node in radians
         inc (float): Inclination in radians
         omega (float): Argument of periapsis in radians
         
     Returns:
-        ndarray: Position vector in ECI frame [x, y, z]
+        ndarray: Position vector(s) in ECI frame, same shape as r_perifocal
     """
-    # Rotation matrices
-    R3_W = np.array([
-        [ np.cos(RAAN),  np.sin(RAAN), 0],
-        [-np.sin(RAAN),  np.cos(RAAN), 0],
-        [           0,             0, 1]
-    ])
-    
-    R1_i = np.array([
-        [1,          0,           0],
-        [0,  np.cos(inc),  np.sin(inc)],
-        [0, -np.sin(inc),  np.cos(inc)]
-    ])
-    
-    R3_w = np.array([
-        [ np.cos(omega),  np.sin(omega), 0],
-        [-np.sin(omega),  np.cos(omega), 0],
-        [         0,          0, 1]
-    ])
-    
-    # Combined rotation matrix (transposed for inverse transformation)
-    Q = R3_W.T @ R1_i.T @ R3_w.T
-    
-    # Transform the position vector
-    return Q @ r_perifocal
+    return rotation_matrix(RAAN, inc, omega) @ r_perifocal
 
 def propagate_orbit(spacecraft, time_array):
     """
@@ -110,52 +159,103 @@ def propagate_orbit(spacecraft, time_array):
         time_array (ndarray): Array of times in seconds from epoch
         
     Returns:
-        tuple: (X, Y, Z) arrays of positions in ECI frame
+        tuple: (X, Y, Z) float32 arrays of positions in ECI frame
     """
-    # Pre-allocate position arrays
-    n_steps = len(time_array)
-    X = np.zeros(n_steps)
-    Y = np.zeros(n_steps)
-    Z = np.zeros(n_steps)
-    
     # Extract orbital elements
     a = spacecraft.a
     e = spacecraft.e
-    inc = spacecraft.i
-    RAAN = spacecraft.RAAN
-    omega = spacecraft.omega
     M0 = spacecraft.M0
     n = spacecraft.n
     
-    # Compute positions at each time step
-    for k in range(n_steps):
-        t = time_array[k]
-        
-        # Mean anomaly at time t
-        M = M0 + n * t
-        
-        # Solve for eccentric anomaly
-        E = solve_kepler(M, e)
-        
-        # Calculate true anomaly
-        nu = true_anomaly_from_eccentric(E, e)
-        
-        # Calculate orbital radius
-        r = orbital_radius(a, e, E)
-        
-        # Position in perifocal coordinates
-        r_perifocal = np.array([
-            r * np.cos(nu),
-            r * np.sin(nu),
-            0.0
-        ])
-        
-        # Transform to ECI
-        r_eci = perifocal_to_eci(r_perifocal, RAAN, inc, omega)
+    # Orbit-constant rotation, cached on the spacecraft
+    Q = spacecraft.get_rotation_matrix()
+    
+    time_array = np.asarray(time_array, dtype=float)
+    
+    # Use the compiled kernel when Numba is available
+    if _propagate is not None:
+        X = np.empty_like(time_array, dtype=np.float32)
+        Y = np.empty_like(time_array, dtype=np.float32)
+        Z = np.empty_like(time_array, dtype=np.float32)
+        _propagate(a, e, Q, M0, n, time_array, X, Y, Z)
+        return X, Y, Z
+    
+    # Mean anomaly at every time step, wrapped to [-pi, pi]. solve_kepler
+    # returns E with whole revolutions restored, so wrapping here keeps the
+    # sin/cos of E below on small arguments; positions only need E mod 2pi
+    M = M0 + n * time_array
+    M = np.remainder(M + np.pi, 2.0 * np.pi) - np.pi
+    
+    # Solve for eccentric anomaly
+    E = solve_kepler(M, e)
+    
+    # Position in perifocal coordinates directly from E, avoiding the
+    # true anomaly: x = a(cos E - e), y = a sqrt(1 - e^2) sin E
+    sE, cE = np.sin(E), np.cos(E)
+    x_orb = a * (cE - e)
+    y_orb = a * np.sqrt(1.0 - e * e) * sE
+    
+    # Transform to ECI; z_orb is zero so only the first two columns are used
+    X = Q[0, 0] * x_orb + Q[0, 1] * y_orb
+    Y = Q[1, 0] * x_orb + Q[1, 1] * y_orb
+    Z = Q[2, 0] * x_orb + Q[2, 1] * y_orb
+    
+    # Positions are solved in float64 but returned as float32 for plotting
+    return X.astype(np.float32), Y.astype(np.float32), Z.astype(np.float32)
+
+def propagate_orbits_batch(satellites, time_array):
+    """
+    Propagate orbital motion for many spacecraft over a shared time array
+    
+    Parameters:
+        satellites: SatelliteCatalog, or a list of Spacecraft objects
+        time_array (ndarray): Array of times in seconds from epoch
         
-        # Store positions
-        X[k] = r_eci[0]
-        Y[k] = r_eci[1]
-        Z[k] = r_eci[2]
+    Returns:
+        tuple: (X, Y, Z) float32 arrays of positions in ECI frame, each of shape
+            (number of satellites, len(time_array))
+    """
+    # Read element columns from a catalog, or pack them from a list
+    def elements(name):
+        if hasattr(satellites, name):
+            return np.asarray(getattr(satellites, name), dtype=float)
+        return np.array([getattr(sat, name) for sat in satellites], dtype=float)
+    
+    a = elements('a')
+    e = elements('e')
+    inc = elements('i')
+    RAAN = elements('RAAN')
+    omega = elements('omega')
+    M0 = elements('M0')
+    n = elements('n')
+    
+    time_array = np.asarray(time_array, dtype=float)
+    
+    # Use the compiled kernel when Numba is available
+    if _propagate_batch is not None:
+        shape = (len(a), len(time_array))
+        X = np.empty(shape, dtype=np.float32)
+        Y = np.empty(shape, dtype=np.float32)
+        Z = np.empty(shape, dtype=np.float32)
+        _propagate_batch(a, e, inc, RAAN, omega, M0, n, time_array, X, Y, Z)
+        return X, Y, Z
+    
+    # Mean anomaly for every satellite and time step, shape (Nsat, Nsteps),
+    # wrapped to [-pi, pi] so the sin/cos of E below stay on small arguments
+    M = M0[:, None] + n[:, None] * time_array[None, :]
+    M = np.remainder(M + np.pi, 2.0 * np.pi) - np.pi
+    
+    # Solve for eccentric anomaly
+    E = solve_kepler(M, e[:, None])
+    
+    # Position in perifocal coordinates directly from E
+    x_orb = a[:, None] * (np.cos(E) - e[:, None])
+    y_orb = (a * np.sqrt(1.0 - e * e))[:, None] * np.sin(E)
+    
+    # Rotate every satellite with its own Q, using only the x/y columns
+    Q = np.moveaxis(rotation_matrix(RAAN, inc, omega), -1, 0)
+    r_eci = np.einsum('sij,sjk->sik', Q[:, :, :2], np.stack([x_orb, y_orb], axis=1))
     
-    return X, Y, Z 
\ No newline at end of file
+    # Positions are solved in float64 but returned as float32 for plotting
+    r_eci = r_eci.astype(np.float32)
+    return r_eci[:, 0], r_eci[:, 1], r_eci[:, 2]
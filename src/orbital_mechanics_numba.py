@@ -0,0 +1,121 @@
+"""
+orbital_mechanics_numba.py - Numba-compiled orbit propagation kernels
+"""
+
+import math
+
+from numba import njit, prange
+
+@njit(fastmath=True, cache=True)
+def _solve_kepler(M, e):
+    """
+    Solve Kepler's equation for a single mean anomaly using Markley's method
+
+    Parameters:
+        M (float): Mean anomaly in radians
+        e (float): Eccentricity
+
+    Returns:
+        float: Eccentric anomaly in radians
+    """
+    # Reduce mean anomaly to [-pi, pi]
+    M_red = (M + math.pi) % (2.0 * math.pi) - math.pi
+
+    # Cubic starting estimate
+    pi2 = math.pi * math.pi
+    alpha = (3.0 * pi2 + 1.6 * math.pi * (math.pi - abs(M_red)) / (1.0 + e)) / (pi2 - 6.0)
+    d = 3.0 * (1.0 - e) + alpha * e
+    q = 2.0 * alpha * d * (1.0 - e) - M_red * M_red
+    r = 3.0 * alpha * d * (d - 1.0 + e) * M_red + M_red * M_red * M_red
+    w = (abs(r) + math.sqrt(q * q * q + r * r)) ** (2.0 / 3.0)
+    E1 = (2.0 * r * w / (w * w + w * q + q * q) + M_red) / d
+
+    # Fifth-order correction; adjacent sin/cos compile to one sincos call
+    es = e * math.sin(E1)
+    ec = e * math.cos(E1)
+    f0 = E1 - es - M_red
+    f1 = 1.0 - ec
+    d3 = -f0 / (f1 - 0.5 * f0 * es / f1)
+    d4 = -f0 / (f1 + 0.5 * d3 * es + d3 * d3 * ec / 6.0)
+    d5 = -f0 / (f1 + 0.5 * d4 * es + d4 * d4 * ec / 6.0 - d4 * d4 * d4 * es / 24.0)
+
+    return E1 + d5
+
+@njit(fastmath=True, cache=True)
+def _rotation_terms(RAAN, i, omega):
+    """
+    Expanded perifocal to ECI rotation terms (third column unused since z = 0)
+
+    Parameters:
+        RAAN, i, omega (float): Orientation angles in radians
+
+    Returns:
+        tuple: (Q00, Q01, Q10, Q11, Q20, Q21)
+    """
+    cosR, sinR = math.cos(RAAN), math.sin(RAAN)
+    cosi, sini = math.cos(i), math.sin(i)
+    cosw, sinw = math.cos(omega), math.sin(omega)
+
+    return (cosR * cosw - sinR * sinw * cosi,
+            -cosR * sinw - sinR * cosw * cosi,
+            sinR * cosw + cosR * sinw * cosi,
+            -sinR * sinw + cosR * cosw * cosi,
+            sinw * sini,
+            cosw * sini)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _propagate(a, e, Q, M0, n, t_array, X, Y, Z):
+    """
+    Propagate a single orbit over a time array, writing into X, Y, Z
+
+    Parameters:
+        a, e, M0, n (float): Orbital elements
+        Q (ndarray): 3x3 perifocal to ECI rotation matrix
+        t_array (ndarray): Array of times in seconds from epoch
+        X, Y, Z (ndarray): Output arrays, same length as t_array
+    """
+    # Orbit-constant terms (third column unused since z = 0)
+    Q00, Q01 = Q[0, 0], Q[0, 1]
+    Q10, Q11 = Q[1, 0], Q[1, 1]
+    Q20, Q21 = Q[2, 0], Q[2, 1]
+    b = a * math.sqrt(1.0 - e * e)
+
+    for k in prange(t_array.shape[0]):
+        E = _solve_kepler(M0 + n * t_array[k], e)
+
+        # Adjacent sin/cos of the same argument compile to one sincos call
+        sinE, cosE = math.sin(E), math.cos(E)
+
+        # Perifocal coordinates directly from E, avoiding the true anomaly
+        x_orb = a * (cosE - e)
+        y_orb = b * sinE
+
+        X[k] = Q00 * x_orb + Q01 * y_orb
+        Y[k] = Q10 * x_orb + Q11 * y_orb
+        Z[k] = Q20 * x_orb + Q21 * y_orb
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _propagate_batch(a, e, i, RAAN, omega, M0, n, t_array, X, Y, Z):
+    """
+    Propagate many orbits over a shared time array, writing into X, Y, Z
+
+    Parameters:
+        a, e, i, RAAN, omega, M0, n (ndarray): Orbital elements, length Nsat
+        t_array (ndarray): Array of times in seconds from epoch
+        X, Y, Z (ndarray): Output arrays of shape (Nsat, len(t_array))
+    """
+    for s in prange(a.shape[0]):
+        # Orbit-constant terms
+        Q00, Q01, Q10, Q11, Q20, Q21 = _rotation_terms(RAAN[s], i[s], omega[s])
+        b = a[s] * math.sqrt(1.0 - e[s] * e[s])
+
+        for k in range(t_array.shape[0]):
+            E = _solve_kepler(M0[s] + n[s] * t_array[k], e[s])
+            sinE, cosE = math.sin(E), math.cos(E)
+
+            x_orb = a[s] * (cosE - e[s])
+            y_orb = b * sinE
+
+            X[s, k] = Q00 * x_orb + Q01 * y_orb
+            Y[s, k] = Q10 * x_orb + Q11 * y_orb
+            Z[s, k] = Q20 * x_orb + Q21 * y_orb
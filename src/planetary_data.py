@@ -19,7 +19,7 @@ class Earth:
     ANGULAR_VELOCITY = 2.0 * np.pi / ROTATION_PERIOD  # rad/s
     
     @staticmethod
-    def get_ellipsoid_points(u_points=40, v_points=30):
+    def get_ellipsoid_points(u_points=20, v_points=15):
         """
         Generate points for plotting Earth as an ellipsoid
         
@@ -28,14 +28,19 @@ class Earth:
             v_points (int): Number of points in v direction (latitude)
             
         Returns:
-            tuple: (X, Y, Z) coordinates of ellipsoid points
+            tuple: (X, Y, Z) coordinates of ellipsoid points (Z is a read-only view)
         """
         u = np.linspace(0, 2 * np.pi, u_points)
         v = np.linspace(0, np.pi, v_points)
         
-        X = Earth.RADIUS_EQUATORIAL * np.outer(np.cos(u), np.sin(v))
-        Y = Earth.RADIUS_EQUATORIAL * np.outer(np.sin(u), np.sin(v))
-        Z = Earth.RADIUS_POLAR * np.outer(np.ones_like(u), np.cos(v))
+        # Evaluate each trig term once
+        cu, su = np.cos(u), np.sin(u)
+        cv, sv = np.cos(v), np.sin(v)
+        
+        X = Earth.RADIUS_EQUATORIAL * np.outer(cu, sv)
+        Y = Earth.RADIUS_EQUATORIAL * np.outer(su, sv)
+        # Z only varies with latitude; broadcast rather than allocate a grid
+        Z = np.broadcast_to(Earth.RADIUS_POLAR * cv, (u.size, v.size))
         
         return X, Y, Z
 
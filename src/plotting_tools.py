@@ -4,11 +4,22 @@ plotting_tools.py - Visualization tools for orbital simulations
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import ArtistAnimation, FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
 
 from .planetary_data import Earth, CELESTIAL_BODIES
 
+class _ProjectedArtistAnimation(ArtistAnimation):
+    """ArtistAnimation that re-projects each frame's 3D artists before drawing"""
+    
+    def _draw_frame(self, artists):
+        # Hidden frames are skipped when the axes project during a full
+        # redraw, and blitting does not project at all, so a frame would
+        # otherwise be drawn with the view from when it was last shown
+        for artist in artists:
+            artist.do_3d_projection()
+        super()._draw_frame(artists)
+
 class OrbitPlotter:
     """Class for creating 3D orbital visualizations"""
     
@@ -21,24 +32,61 @@ class OrbitPlotter:
             dpi (int): Dots per inch for the figure
             bg_color (str): Background color for the plot
         """
-        self.fig = plt.figure(figsize=figsize, dpi=dpi)
-        self.ax = self.fig.add_subplot(111, projection='3d')
-        self.ax.set_facecolor(bg_color)
-        
-        # Set labels and title
-        self.ax.set_xlabel('X (km)')
-        self.ax.set_ylabel('Y (km)')
-        self.ax.set_zlabel('Z (km)')
-        self.ax.set_title('Orbital Visualization')
-        self.ax.set_box_aspect([1, 1, 1])
+        # The figure is only built when first needed, so headless use of
+        # the plotter does not create one
+        self.figsize = figsize
+        self.dpi = dpi
+        self.bg_color = bg_color
+        self._fig = None
+        self._ax = None
         
         # Stored data for animation
         self.spacecraft_data = []
         self.lines = []
-        self.markers = []
         self.animation = None
         
-    def plot_earth(self, wireframe=True, alpha=0.5, color='purple'):
+        # All spacecraft markers share one scatter collection, built lazily
+        # so adding spacecraft one at a time does not rebuild it every call
+        self._scatter = None
+        self._scatter_count = 0
+        
+        # Per-frame marker scatters of a pre-rendered animation
+        self._prerendered = []
+        
+    @property
+    def fig(self):
+        """Matplotlib figure, created on first access"""
+        if self._fig is None:
+            self._build_figure()
+        return self._fig
+        
+    @property
+    def ax(self):
+        """3D axes, created on first access"""
+        if self._ax is None:
+            self._build_figure()
+        return self._ax
+        
+    def _build_figure(self):
+        """Create the figure and 3D axes"""
+        self._fig = plt.figure(figsize=self.figsize, dpi=self.dpi)
+        self._ax = self._fig.add_subplot(111, projection='3d')
+        self._ax.set_facecolor(self.bg_color)
+        
+        # Set labels and title
+        self._ax.set_xlabel('X (km)')
+        self._ax.set_ylabel('Y (km)')
+        self._ax.set_zlabel('Z (km)')
+        self._ax.set_title('Orbital Visualization')
+        self._ax.set_box_aspect([1, 1, 1])
+        
+        # Hide the axis panes and gridlines, which are redrawn every frame
+        for axis in (self._ax.xaxis, self._ax.yaxis, self._ax.zaxis):
+            axis.pane.fill = False
+            axis.pane.set_edgecolor((1, 1, 1, 0))
+        self._ax.grid(False)
+        
+    def plot_earth(self, wireframe=False, alpha=0.5, color='purple'):
         """
         Add Earth to the plot
         
@@ -53,7 +101,10 @@ class OrbitPlotter:
         if wireframe:
             self.ax.plot_wireframe(X, Y, Z, color=color, alpha=alpha, linewidth=0.5)
         else:
-            self.ax.plot_surface(X, Y, Z, color=color, alpha=alpha)
+            # A single unlit surface is far cheaper to redraw than wireframe lines
+            self.ax.plot_surface(X, Y, Z, color=color, alpha=alpha,
+                                 rstride=1, cstride=1, linewidth=0,
+                                 antialiased=False, zorder=0)
             
         return self
     
@@ -114,26 +165,69 @@ class OrbitPlotter:
             color (str): Color for the spacecraft and orbit
             marker_size (float): Size of the marker representing the spacecraft
         """
-        # Store spacecraft data for animation
+        self._store_spacecraft(X, Y, Z, label, color, marker_size)
+        return self
+        
+    def add_spacecraft_batch(self, X, Y, Z, labels=None, colors=None, marker_size=6):
+        """
+        Add many spacecraft to the animation at once
+        
+        Parameters:
+            X, Y, Z (array): Position coordinates of shape (Nsat, Nsteps),
+                e.g. from propagate_orbits_batch
+            labels (list): Labels for the legend, one per spacecraft
+            colors (list): Colors for the spacecraft and orbits
+            marker_size (float): Size of the markers representing the spacecraft
+        """
+        for k in range(len(X)):
+            label = labels[k] if labels is not None else None
+            color = colors[k] if colors is not None else None
+            self._store_spacecraft(X[k], Y[k], Z[k], label, color, marker_size)
+            
+        return self
+        
+    def _store_spacecraft(self, X, Y, Z, label, color, marker_size):
+        """Store spacecraft data for animation and plot its orbit path"""
+        # Float32 is ample for plotting
+        X = np.asarray(X, dtype=np.float32)
+        Y = np.asarray(Y, dtype=np.float32)
+        Z = np.asarray(Z, dtype=np.float32)
+        
+        # Plot the orbit path
+        line = self.plot_orbit(X, Y, Z, label=label, color=color)
+        self.lines.append(line)
+        
+        # The marker takes the orbit's color, including auto-assigned ones
         self.spacecraft_data.append({
             'X': X,
             'Y': Y,
             'Z': Z,
             'label': label,
-            'color': color
+            'color': line.get_color(),
+            'marker_size': marker_size
         })
         
-        # Plot the orbit path
-        line = self.plot_orbit(X, Y, Z, label=label, color=color)
-        self.lines.append(line)
-        
-        # Create marker for the spacecraft
-        marker, = self.ax.plot([X[0]], [Y[0]], [Z[0]], 
-                              marker='o', markersize=marker_size,
-                              color=color, markerfacecolor=color)
-        self.markers.append(marker)
+    def _get_scatter(self):
+        """Return the marker scatter, rebuilding it if spacecraft were added"""
+        if self._scatter_count != len(self.spacecraft_data):
+            if self._scatter is not None:
+                self._scatter.remove()
+                
+            self._scatter = self._scatter_frame(0)
+            self._scatter_count = len(self.spacecraft_data)
+            
+        return self._scatter
         
-        return self
+    def _scatter_frame(self, frame):
+        """Create a scatter of every spacecraft's position at a frame"""
+        return self.ax.scatter(
+            [sat_data['X'][frame] for sat_data in self.spacecraft_data],
+            [sat_data['Y'][frame] for sat_data in self.spacecraft_data],
+            [sat_data['Z'][frame] for sat_data in self.spacecraft_data],
+            c=[sat_data['color'] for sat_data in self.spacecraft_data],
+            s=[sat_data['marker_size'] ** 2 for sat_data in self.spacecraft_data],
+            depthshade=False
+        )
         
     def set_equal_aspect(self):
         """Set equal aspect ratio for the 3D plot"""
@@ -152,17 +246,24 @@ class OrbitPlotter:
         
         return self
         
-    def create_animation(self, interval=30, frames=None, repeat=True):
+    def create_animation(self, interval=30, frames=None, repeat=True, prerender=False):
         """
         Create an animation of the spacecraft motion
         
+        Only the spacecraft markers are redrawn each frame, so axis limits
+        should be fixed (e.g. with set_equal_aspect()) beforehand.
+        
         Parameters:
             interval (int): Time between frames in milliseconds
             frames (int): Number of frames to use (defaults to length of data)
             repeat (bool): Whether to repeat the animation
+            prerender (bool): If True, create one marker scatter per frame up
+                front and cycle their visibility with ArtistAnimation instead
+                of updating markers in a per-frame callback. Keeps every
+                frame's artist in memory, so best suited to short animations.
             
         Returns:
-            FuncAnimation: The created animation
+            FuncAnimation or ArtistAnimation: The created animation
         """
         if not self.spacecraft_data:
             raise ValueError("No spacecraft data added. Use add_spacecraft() first.")
@@ -171,31 +272,74 @@ class OrbitPlotter:
             # Use the length of the first spacecraft's data
             frames = len(self.spacecraft_data[0]['X'])
             
+        # Remove the markers of any earlier pre-rendered animation
+        for artist in self._prerendered:
+            artist.remove()
+        self._prerendered = []
+        
+        # The live markers are replaced by the pre-rendered ones, if used
+        scatter = self._get_scatter()
+        scatter.set_visible(not prerender)
+        
+        # Freeze the axes so limits and ticks are not recomputed per frame,
+        # and draw once so the static background is laid out up front
+        self.ax.set_autoscale_on(False)
+        self.fig.canvas.draw()
+        
+        if prerender:
+            self.animation = self._create_artist_animation(interval, frames, repeat)
+            return self.animation
+            
+        # Positions as (Nsat, frames) arrays, so each frame is one column
+        X = np.stack([sat_data['X'][:frames] for sat_data in self.spacecraft_data])
+        Y = np.stack([sat_data['Y'][:frames] for sat_data in self.spacecraft_data])
+        Z = np.stack([sat_data['Z'][:frames] for sat_data in self.spacecraft_data])
+        
+        # Reset markers to their starting positions; with blitting only the
+        # marker scatter is redrawn on each frame
+        def init():
+            return update(0)
+            
         # Animation update function
         def update(frame):
-            for i, sat_data in enumerate(self.spacecraft_data):
-                self.markers[i].set_data_3d(
-                    [sat_data['X'][frame]],
-                    [sat_data['Y'][frame]],
-                    [sat_data['Z'][frame]]
-                )
-            return self.markers
+            scatter._offsets3d = (X[:, frame], Y[:, frame], Z[:, frame])
+            # Blitted frames only call draw_artist, which does not re-project
+            # 3D collections, so project the new offsets here
+            scatter.do_3d_projection()
+            return (scatter,)
             
         # Create the animation
         self.animation = FuncAnimation(
-            self.fig, update, frames=frames,
-            interval=interval, blit=False, repeat=repeat
+            self.fig, update, frames=frames, init_func=init,
+            interval=interval, blit=True, repeat=repeat
         )
         
         return self.animation
         
+    def _create_artist_animation(self, interval, frames, repeat):
+        """Build an ArtistAnimation from pre-rendered spacecraft markers"""
+        self._prerendered = [self._scatter_frame(k) for k in range(frames)]
+        artists = [[artist] for artist in self._prerendered]
+        
+        return _ProjectedArtistAnimation(self.fig, artists, interval=interval,
+                                         blit=True, repeat=repeat)
+        
     def add_legend(self, **kwargs):
-        """Add a legend to the plot with customizable parameters"""
+        """
+        Add a legend to the plot with customizable parameters
+        
+        Defaults to a fixed 'upper left' location, since loc='best' searches
+        for a new position on every redraw.
+        """
+        kwargs.setdefault('loc', 'upper left')
         self.ax.legend(**kwargs)
         return self
         
     def show(self):
         """Display the plot or animation"""
+        if self.spacecraft_data:
+            self._get_scatter()
+            
         plt.tight_layout()
         plt.show()
         
@@ -2,9 +2,65 @@
 spacecraft.py - Spacecraft handling and TLE processing module
 """
 
+import os
+import zipfile
 import numpy as np
 from datetime import datetime, timedelta
 
+from .orbital_mechanics import rotation_matrix
+
+def _tle_column(lines, start, stop):
+    """
+    Slice a fixed-width column out of an array of TLE lines
+    
+    Parameters:
+        lines (ndarray): (N, 69) array of single bytes, one row per TLE line
+        start (int): First character index of the field
+        stop (int): One past the last character index of the field
+        
+    Returns:
+        ndarray: Length-N array of byte strings holding the field
+    """
+    return np.ascontiguousarray(lines[:, start:stop]).view(f'S{stop - start}').ravel()
+
+def _parse_tle_columns(lines1, lines2, mu):
+    """
+    Convert TLE line pairs to orbital element arrays, one column at a time
+    
+    Parameters:
+        lines1 (list): First lines of the TLEs
+        lines2 (list): Second lines of the TLEs
+        mu (float): Gravitational parameter in km³/s²
+        
+    Returns:
+        dict: Arrays of names, epochs, a, e, i, RAAN, omega, M0 and n
+    """
+    # Fixed-width (N, 69) byte arrays, so every field is a column slice
+    line1 = np.array(lines1, dtype='S69').view('S1').reshape(-1, 69)
+    line2 = np.array(lines2, dtype='S69').view('S1').reshape(-1, 69)
+    
+    # Epoch from line 1, with the same century cutoff as parse_tle
+    epoch_year = _tle_column(line1, 18, 20).astype(int)
+    epoch_dayFrac = _tle_column(line1, 20, 32).astype(float)
+    year_full = np.where(epoch_year < 57, 2000 + epoch_year, 1900 + epoch_year)
+    epochs = ((year_full - 1970).astype('datetime64[Y]').astype('datetime64[us]')
+              + np.round((epoch_dayFrac - 1) * 86400e6).astype('timedelta64[us]'))
+    
+    # Orbital elements from line 2
+    n = _tle_column(line2, 52, 63).astype(float) * 2.0 * np.pi / 86400.0  # rad/sec
+    
+    return {
+        'names': np.char.strip(np.char.decode(_tle_column(line2, 2, 7))),
+        'epochs': epochs,
+        'a': (mu / n**2) ** (1.0/3.0),
+        'e': _tle_column(line2, 26, 33).astype(float) / 1e7,
+        'i': np.radians(_tle_column(line2, 8, 16).astype(float)),
+        'RAAN': np.radians(_tle_column(line2, 17, 25).astype(float)),
+        'omega': np.radians(_tle_column(line2, 34, 42).astype(float)),
+        'M0': np.radians(_tle_column(line2, 43, 51).astype(float)),
+        'n': n
+    }
+
 class Spacecraft:
     """Class representing a spacecraft or satellite defined by TLE data"""
     
@@ -32,6 +88,10 @@ class Spacecraft:
         self.n = 0.0         # Mean motion (rad/sec)
         self.epoch = None    # Epoch as datetime
         
+        # Cached perifocal to ECI rotation and the angles it was built from
+        self._Q = None
+        self._Q_angles = None
+        
         # If TLE data is provided, parse it
         if tle_line1 and tle_line2:
             self.parse_tle(tle_line1, tle_line2)
@@ -82,38 +142,180 @@ class Spacecraft:
         # Calculate semi-major axis from mean motion
         self.a = (self.MU_EARTH / (self.n**2)) ** (1.0/3.0)
         
+        # Orientation is fixed once parsed, so build the rotation now
+        self.get_rotation_matrix()
+        
     def get_period(self):
         """Return orbital period in seconds"""
         return 2.0 * np.pi / self.n
         
+    def get_rotation_matrix(self):
+        """Return the cached 3x3 perifocal to ECI rotation matrix"""
+        angles = (self.RAAN, self.i, self.omega)
+        if self._Q_angles != angles:
+            self._Q = rotation_matrix(self.RAAN, self.i, self.omega)
+            self._Q_angles = angles
+        return self._Q
+        
     def __str__(self):
         """String representation of the spacecraft"""
         return f"Spacecraft: {self.name}, a={self.a:.1f} km, e={self.e:.4f}, i={np.degrees(self.i):.1f}°"
         
     @staticmethod
-    def from_tle_file(filename):
+    def from_tle_file(filename, use_cache=True):
         """
         Create a list of Spacecraft objects from a TLE file
         
         Parameters:
             filename (str): Path to the TLE file
+            use_cache (bool): Whether to read and write the parsed catalog
+                cache (see SatelliteCatalog.from_tle_file)
             
         Returns:
             list: List of Spacecraft objects
         """
-        satellites = []
+        return SatelliteCatalog.from_tle_file(filename, use_cache).to_spacecraft()
+
+class SatelliteCatalog:
+    """Collection of satellites stored as parallel arrays of orbital elements"""
+    
+    # Per-satellite arrays, as stored in the .npz cache
+    FIELDS = ('names', 'epochs', 'a', 'e', 'i', 'RAAN', 'omega', 'M0', 'n')
+    
+    # Suffix of the parsed catalog cache written next to a TLE file
+    CACHE_SUFFIX = '.catalog.npz'
+    
+    # Version of the cache layout and parser; bump when either changes so
+    # that existing caches are re-parsed
+    CACHE_VERSION = 1
+    
+    def __init__(self, names, epochs, a, e, i, RAAN, omega, M0, n):
+        """
+        Initialize a catalog from orbital element arrays
         
+        Parameters:
+            names (array): Names of the satellites
+            epochs (array): Epochs as datetime64
+            a (array): Semi-major axes (km)
+            e (array): Eccentricities
+            i (array): Inclinations (rad)
+            RAAN (array): Right Ascensions of Ascending Node (rad)
+            omega (array): Arguments of Periapsis (rad)
+            M0 (array): Mean Anomalies at epoch (rad)
+            n (array): Mean motions (rad/sec)
+        """
+        self.names = np.asarray(names, dtype=str)
+        self.epochs = np.asarray(epochs, dtype='datetime64[us]')
+        self.a = np.asarray(a, dtype=float)
+        self.e = np.asarray(e, dtype=float)
+        self.i = np.asarray(i, dtype=float)
+        self.RAAN = np.asarray(RAAN, dtype=float)
+        self.omega = np.asarray(omega, dtype=float)
+        self.M0 = np.asarray(M0, dtype=float)
+        self.n = np.asarray(n, dtype=float)
+        
+    @classmethod
+    def from_tle_file(cls, filename, use_cache=True):
+        """
+        Create a catalog from a TLE file
+        
+        The parsed arrays are cached in a .npz file next to the TLE file and
+        reused for as long as the TLE file's modification time and size and
+        the cache version are unchanged.
+        
+        Parameters:
+            filename (str): Path to the TLE file
+            use_cache (bool): Whether to read and write the .npz cache
+            
+        Returns:
+            SatelliteCatalog: Catalog of all satellites in the file
+        """
+        cache_file = os.fspath(filename) + cls.CACHE_SUFFIX
+        source_stat = os.stat(filename)
+        
+        # Identifies the cache layout and the TLE file it was parsed from
+        cache_key = {
+            'cache_version': cls.CACHE_VERSION,
+            'source_mtime': source_stat.st_mtime,
+            'source_size': source_stat.st_size
+        }
+        
+        if use_cache:
+            catalog = cls._load_cache(cache_file, cache_key)
+            if catalog is not None:
+                return catalog
+                
+        catalog = cls._parse_tle_file(filename)
+        
+        if use_cache:
+            try:
+                np.savez(cache_file, **cache_key,
+                         **{field: getattr(catalog, field) for field in cls.FIELDS})
+            except OSError:
+                # Caching is best effort, e.g. the data directory may be read-only
+                pass
+                
+        return catalog
+        
+    @classmethod
+    def _load_cache(cls, cache_file, cache_key):
+        """Load a cached catalog, or return None if it is missing or stale"""
+        if not os.path.exists(cache_file):
+            return None
+            
+        try:
+            with np.load(cache_file) as cached:
+                if any(cached[key] != value for key, value in cache_key.items()):
+                    return None
+                return cls(**{field: cached[field] for field in cls.FIELDS})
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # Unreadable or outdated cache layout; fall back to parsing
+            return None
+            
+    @classmethod
+    def _parse_tle_file(cls, filename):
+        """Parse every TLE in a file into a catalog"""
         with open(filename, 'r') as f:
             lines = [line.strip() for line in f.readlines()]
         
-        # Collect valid TLE pairs
-        idx = 0
-        while idx < len(lines) - 1:
-            if lines[idx].startswith('1') and lines[idx+1].startswith('2'):
-                sat = Spacecraft(tle_line1=lines[idx], tle_line2=lines[idx+1])
-                satellites.append(sat)
-                idx += 2
-            else:
-                idx += 1
-                
-        return satellites
\ No newline at end of file
+        # Collect valid TLE pairs: a line starting with '1' directly
+        # followed by one starting with '2'
+        first_char = np.array(lines, dtype='U1')
+        pair_start = np.flatnonzero((first_char[:-1] == '1') & (first_char[1:] == '2'))
+        lines1 = [lines[idx] for idx in pair_start]
+        lines2 = [lines[idx + 1] for idx in pair_start]
+        
+        return cls(**_parse_tle_columns(lines1, lines2, Spacecraft.MU_EARTH))
+        
+    def __len__(self):
+        """Number of satellites in the catalog"""
+        return len(self.names)
+        
+    def get_periods(self):
+        """Return orbital periods in seconds"""
+        return 2.0 * np.pi / self.n
+        
+    def get_spacecraft(self, index):
+        """
+        Create a Spacecraft object for one satellite in the catalog
+        
+        Parameters:
+            index (int): Index of the satellite
+            
+        Returns:
+            Spacecraft: Spacecraft with the satellite's orbital elements
+        """
+        sat = Spacecraft(name=str(self.names[index]))
+        sat.a = float(self.a[index])
+        sat.e = float(self.e[index])
+        sat.i = float(self.i[index])
+        sat.RAAN = float(self.RAAN[index])
+        sat.omega = float(self.omega[index])
+        sat.M0 = float(self.M0[index])
+        sat.n = float(self.n[index])
+        sat.epoch = self.epochs[index].astype(object)
+        return sat
+        
+    def to_spacecraft(self):
+        """Return a list of Spacecraft objects, one per satellite"""
+        return [self.get_spacecraft(k) for k in range(len(self))]